@@ -3,15 +3,23 @@
 import hashlib
 import logging
 import os
+import secrets
+import shutil
 import sys
+import threading
 import base64
-
-import mistune
-from dotenv import load_dotenv
-from google import genai
-from google.genai import types
-from PyQt6.QtCore import QSettings, QThread, pyqtSignal
-from PyQt6.QtGui import QKeySequence, QShortcut
+import contextlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from PyQt6.QtCore import (
+    QObject,
+    QRunnable,
+    QSettings,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QKeySequence, QShortcut, QTextCursor
 from PyQt6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -21,6 +29,7 @@ from PyQt6.QtWidgets import (
     QMessageBox,
     QProgressBar,
     QPushButton,
+    QSpinBox,
     QTextEdit,
     QVBoxLayout,
     QWidget,
@@ -35,39 +44,100 @@ logging.basicConfig(
 def calculate_sha256(file_path):
     """Calculate SHA-256 hash of a file."""
     sha256_hash = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        # Read file in chunks to handle large files efficiently
-        for chunk in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(chunk)
+    # Read into one reusable 1 MiB buffer: few syscalls, no per-chunk copies
+    buffer = bytearray(1024 * 1024)
+    view = memoryview(buffer)
+    with open(file_path, "rb", buffering=0) as f:
+        while size := f.readinto(buffer):
+            sha256_hash.update(view[:size])
     return sha256_hash.hexdigest()
 
 
-class ProcessingThread(QThread):
+def cached_sha256(file_path, hash_cache):
     """
-    Thread to handle audio processing using the Gemini API.
-    This simplified version uses a single user prompt to guide the AI,
-    which can handle transcription, summarization, or other tasks in one call.
+    Return the SHA-256 hash of a file, reusing the value in hash_cache
+    (path -> "size:mtime_ns:hash") while the file's size and mtime match.
+    Entries are re-inserted on use so the dict stays in LRU order.
     """
+    stat = os.stat(file_path)
+    signature = f"{stat.st_size}:{stat.st_mtime_ns}"
+    cached_signature, _, file_hash = hash_cache.pop(file_path, "").rpartition(":")
+    if cached_signature != signature:
+        file_hash = calculate_sha256(file_path)
+    hash_cache[file_path] = f"{signature}:{file_hash}"
+    return file_hash
+
+
+def write_text_atomic(file_path, text):
+    """Write text to a file atomically (temp file + fsync + rename)."""
+    # Replace the file a symlink points to, not the link itself
+    file_path = os.path.realpath(file_path)
+    folder, name = os.path.split(file_path)
+    # Unique name + O_EXCL, so an existing file is never overwritten
+    tmp_path = os.path.join(folder, f".{name}.{secrets.token_hex(4)}.tmp")
+    data = memoryview(text.encode("utf-8"))
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        try:
+            while data:
+                written = os.write(fd, data)
+                data = data[written:]
+            # Single explicit flush to disk instead of relying on close()
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        if os.path.exists(file_path):
+            # Keep the permissions of the file being replaced
+            shutil.copymode(file_path, tmp_path)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        # Never let cleanup mask the original error
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+class ProcessingSignals(QObject):
+    """Signals emitted by ProcessingTask (QRunnable cannot define signals)."""
 
     processing_finished = pyqtSignal(str)
+    result_chunk = pyqtSignal(str)
     error_occurred = pyqtSignal(str, str)
     progress_update = pyqtSignal(int)
     status_update = pyqtSignal(str)
+    batch_job_submitted = pyqtSignal(str, str)
+
+
+class ProcessingTask(QRunnable):
+    """
+    Runnable to handle audio processing using the Gemini API.
+    This simplified version uses a single user prompt to guide the AI,
+    which can handle transcription, summarization, or other tasks in one call.
+    It runs on the global QThreadPool, so worker threads are reused across runs.
+    """
+
+    GEMINI_MODEL = "gemini-2.5-flash"
+    MAX_PARALLEL_UPLOADS = 8
 
     def __init__(
         self,
         audio_file_paths,
-        gemini_api_key,
+        gemini_client,
         user_prompt,
         enable_search=False,
+        hash_cache=None,
+        batch_mode=False,
+        max_parallel_uploads=MAX_PARALLEL_UPLOADS,
     ):
         super().__init__()
+        self.signals = ProcessingSignals()
         self.audio_file_paths = audio_file_paths
-        self.gemini_api_key = gemini_api_key
+        self.gemini_client = gemini_client
         self.user_prompt = user_prompt
         self.enable_search = enable_search
-
-        self.gemini_client = None
+        self.hash_cache = hash_cache if hash_cache is not None else {}
+        self.batch_mode = batch_mode
+        self.max_parallel_uploads = max_parallel_uploads
 
     def run(self):
         logging.info("Processing thread started.")
@@ -80,14 +150,10 @@ class ProcessingThread(QThread):
         )  # Keep track of only newly uploaded files for deletion
 
         try:
+            # Imported here so the SDK (protobuf, httpx, ...) does not delay startup
+            from google.genai import types
 
-            if not self.gemini_api_key:
-                raise ValueError("GEMINI_API_KEY is not set in the .env file")
-
-            self.status_update.emit("Inizializzazione client Gemini...")
-            self.gemini_client = genai.Client(api_key=self.gemini_api_key)
-            logging.info("Gemini client initialized.")
-            self.progress_update.emit(10)
+            self.signals.progress_update.emit(10)
 
             logging.info(
                 "Checking for existing files and uploading new ones to Gemini..."
@@ -96,98 +162,64 @@ class ProcessingThread(QThread):
 
             gemini_contents.append(self.user_prompt)
 
-            # Get list of existing files from Gemini to check for duplicates
-            self.status_update.emit("Controllo file cache su Gemini...")
-            logging.info("Fetching existing Gemini files for cache check...")
-            existing_files = {}  # sha256_hash -> gemini_file
-            try:
-                for existing_file in self.gemini_client.files.list():
-                    if (
-                        hasattr(existing_file, "sha256_hash")
-                        and existing_file.sha256_hash
-                    ):
-                        existing_files[existing_file.sha256_hash] = existing_file
-                    logging.debug(
-                        f"Existing file: {existing_file.name}, SHA-256: {existing_file.sha256_hash}"
-                    )
-                logging.info(f"Found {len(existing_files)} existing files in Gemini")
-            except Exception as e:
-                logging.warning(f"Could not fetch existing files list: {e}")
-                existing_files = {}
-
             num_files = len(self.audio_file_paths)
             cache_hits = 0
             new_uploads = 0
+            prepared_files = [None] * num_files  # Gemini files in input order
+
+            # Hashing and uploads are independent per file and mostly wait on
+            # disk/network, so run them concurrently instead of one by one.
+            # The extra worker fetches the Gemini file list while local hashes
+            # are being computed.
+            max_workers = min(self.max_parallel_uploads, num_files) + 1
+            file_names = [os.path.basename(path) for path in self.audio_file_paths]
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            try:
+                existing_files_future = executor.submit(self.fetch_existing_files)
+                futures = {
+                    executor.submit(
+                        self.prepare_file,
+                        index,
+                        file_path,
+                        file_names[index],
+                        num_files,
+                        existing_files_future,
+                    ): file_names[index]
+                    for index, file_path in enumerate(self.audio_file_paths)
+                }
+                for completed, future in enumerate(as_completed(futures), start=1):
+                    file_name_for_error = futures[future]
+                    index, gemini_file, is_new_upload = future.result()
+                    prepared_files[index] = gemini_file
 
-            for index, file_path in enumerate(self.audio_file_paths):
-                file_name_for_error = os.path.basename(file_path)
-                progress = 15 + int((75 / num_files) * index)
-                self.progress_update.emit(progress)
-
-                # Calculate SHA-256 hash of the local file
-                self.status_update.emit(
-                    f"File {index + 1}/{num_files}: Calcolo hash per {file_name_for_error}..."
-                )
-                logging.info(
-                    f"Processing file {index + 1}/{num_files}: {file_name_for_error}..."
-                )
-                try:
-                    local_hash = calculate_sha256(file_path)
-                    # Convert hex string to base64 to match Gemini's format
-                    local_hash_b64 = base64.b64encode(
-                        local_hash.encode("utf-8")
-                    ).decode("utf-8")
-
-                    logging.info(
-                        f"Local SHA-256 for {file_name_for_error}: {local_hash_b64}"
-                    )
-
-                    # Check if file already exists in Gemini
-                    if local_hash_b64 in existing_files:
-                        existing_file = existing_files[local_hash_b64]
-                        self.status_update.emit(
-                            f"File {file_name_for_error} trovato nella cache."
-                        )
-                        logging.info(
-                            f"File {file_name_for_error} already exists in Gemini (cache hit): {existing_file.name}"
-                        )
-                        gemini_contents.append(existing_file)
-                        uploaded_gemini_files.append(
-                            existing_file
-                        )  # Track for content generation (but don't delete)
-                        cache_hits += 1
-                    else:
-                        # Upload new file
-                        self.status_update.emit(
-                            f"Caricamento di {file_name_for_error} ({index + 1}/{num_files})..."
-                        )
-                        logging.info(f"Uploading new file: {file_name_for_error}...")
-                        gemini_file = self.gemini_client.files.upload(file=file_path)
-                        gemini_contents.append(gemini_file)
-                        uploaded_gemini_files.append(gemini_file)
+                    uploaded_gemini_files.append(gemini_file)
+                    if is_new_upload:
                         newly_uploaded_files.append(gemini_file)  # Track for deletion
-                        logging.info(f"Successfully uploaded {gemini_file.name}")
                         new_uploads += 1
+                    else:
+                        cache_hits += 1
 
-                except Exception as e:
-                    logging.warning(f"Error processing file {file_name_for_error}: {e}")
-                    # Fallback to direct upload if hash calculation fails
-                    logging.info(
-                        f"Falling back to direct upload for: {file_name_for_error}"
+                    self.signals.progress_update.emit(
+                        15 + int((35 / num_files) * completed)
                     )
-                    gemini_file = self.gemini_client.files.upload(file=file_path)
-                    gemini_contents.append(gemini_file)
-                    uploaded_gemini_files.append(gemini_file)
-                    newly_uploaded_files.append(gemini_file)  # Track for deletion
-                    new_uploads += 1
+            except BaseException:
+                # Report the failure now instead of waiting for the other
+                # hashes and uploads to finish
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            executor.shutdown()
+
+            gemini_contents.extend(prepared_files)
 
             logging.info(
-                f"File processing summary: {cache_hits} cached, {new_uploads} newly uploaded"
+                "File processing summary: %s cached, %s newly uploaded",
+                cache_hits,
+                new_uploads,
             )
 
-            self.status_update.emit("Gemini macina...")
+            self.signals.status_update.emit("Gemini macina...")
             logging.info("All files uploaded. Requesting generation from Gemini...")
-            self.progress_update.emit(50)
+            self.signals.progress_update.emit(50)
 
             # Prepara la configurazione per la generazione dei contenuti
             content_config = None
@@ -198,28 +230,45 @@ class ProcessingThread(QThread):
             else:
                 logging.info("Grounding with Google Search is DISABLED.")
 
-            # Esegui la chiamata a Gemini, includendo la configurazione se presente
-            response = self.gemini_client.models.generate_content(
-                model="gemini-2.5-flash",
-                contents=gemini_contents,
-                config=content_config,
-            )
-            result_text = response.text
-
-            self.status_update.emit("Risposta ricevuta. Finalizzazione...")
-            logging.info("Received response from Gemini.")
-            self.progress_update.emit(95)
-
-            self.processing_finished.emit(result_text)
-
-            self.progress_update.emit(100)
+            # Esegui la chiamata a Gemini, includendo la configurazione se presente.
+            if self.batch_mode:
+                # Il risultato arriva più tardi: la GUI controlla il job da sé.
+                batch_job_name = self.submit_batch_job(gemini_contents, content_config)
+                self.signals.batch_job_submitted.emit(
+                    batch_job_name, self.audio_file_paths[0]
+                )
+            else:
+                # La risposta arriva in streaming, così la UI la mostra man mano.
+                result_parts = []
+                for chunk in self.gemini_client.models.generate_content_stream(
+                    model=self.GEMINI_MODEL,
+                    contents=gemini_contents,
+                    config=content_config,
+                ):
+                    chunk_text = chunk.text
+                    if not chunk_text:
+                        continue
+                    if not result_parts:
+                        self.signals.status_update.emit("Gemini sta scrivendo...")
+                        logging.info("Receiving streamed response from Gemini...")
+                    result_parts.append(chunk_text)
+                    self.signals.result_chunk.emit(chunk_text)
+                result_text = "".join(result_parts)
+
+                self.signals.status_update.emit("Risposta ricevuta. Finalizzazione...")
+                logging.info("Received response from Gemini.")
+                self.signals.progress_update.emit(95)
+
+                self.signals.processing_finished.emit(result_text)
+
+            self.signals.progress_update.emit(100)
             logging.info("Processing thread finished successfully.")
 
         except Exception as e:
             error_message = f"Error processing {file_name_for_error}: {e}"
             logging.error(error_message, exc_info=True)
-            self.error_occurred.emit(error_message, file_name_for_error)
-            self.progress_update.emit(0)
+            self.signals.error_occurred.emit(error_message, file_name_for_error)
+            self.signals.progress_update.emit(0)
         finally:
             # Files are preserved on Gemini for future use
             # they last 48h and it's free so no need to delete them
@@ -228,10 +277,197 @@ class ProcessingThread(QThread):
             )
         logging.info("Processing thread run method completed.")
 
+    def submit_batch_job(self, gemini_contents, content_config):
+        """
+        Submits the request through the Gemini Batch API (half the price of a
+        regular call, but it may take hours) and returns the job name.
+        The GUI then polls the job with BatchJobTask.
+        """
+        from google.genai import types
+
+        self.signals.status_update.emit("Invio del job batch a Gemini...")
+        batch_job = self.gemini_client.batches.create(
+            model=self.GEMINI_MODEL,
+            src=[types.InlinedRequest(contents=gemini_contents, config=content_config)],
+        )
+        logging.info("Created Gemini batch job %s", batch_job.name)
+        return batch_job.name
+
+    def fetch_existing_files(self):
+        """Returns a dict mapping SHA-256 hash -> Gemini file for cache checks."""
+        # Get list of existing files from Gemini to check for duplicates
+        self.signals.status_update.emit("Controllo file cache su Gemini...")
+        logging.info("Fetching existing Gemini files for cache check...")
+        existing_files = {}  # sha256_hash -> gemini_file
+        try:
+            for existing_file in self.gemini_client.files.list():
+                if hasattr(existing_file, "sha256_hash") and existing_file.sha256_hash:
+                    existing_files[existing_file.sha256_hash] = existing_file
+                logging.debug(
+                    "Existing file: %s, SHA-256: %s",
+                    existing_file.name,
+                    existing_file.sha256_hash,
+                )
+            logging.info("Found %s existing files in Gemini", len(existing_files))
+        except Exception as e:
+            logging.warning("Could not fetch existing files list: %s", e)
+            existing_files = {}
+        return existing_files
+
+    def prepare_file(
+        self, index, file_path, file_name, num_files, existing_files_future
+    ):
+        """
+        Returns (index, gemini_file, is_new_upload) for a local audio file,
+        reusing the Gemini file with the same SHA-256 hash when available.
+        """
+        # Calculate SHA-256 hash of the local file
+        self.signals.status_update.emit(
+            f"File {index + 1}/{num_files}: Calcolo hash per {file_name}..."
+        )
+        logging.info("Processing file %s/%s: %s...", index + 1, num_files, file_name)
+        try:
+            local_hash = cached_sha256(file_path, self.hash_cache)
+            # Convert hex string to base64 to match Gemini's format
+            local_hash_b64 = base64.b64encode(local_hash.encode("utf-8")).decode(
+                "utf-8"
+            )
+
+            logging.debug("Local SHA-256 for %s: %s", file_name, local_hash_b64)
+
+            # Check if file already exists in Gemini (waits for the listing)
+            existing_files = existing_files_future.result()
+            if local_hash_b64 in existing_files:
+                existing_file = existing_files[local_hash_b64]
+                self.signals.status_update.emit(
+                    f"File {file_name} trovato nella cache."
+                )
+                logging.info(
+                    "File %s already exists in Gemini (cache hit): %s",
+                    file_name,
+                    existing_file.name,
+                )
+                return index, existing_file, False
+
+            # Upload new file
+            self.signals.status_update.emit(
+                f"Caricamento di {file_name} ({index + 1}/{num_files})..."
+            )
+            logging.info("Uploading new file: %s...", file_name)
+            gemini_file = self.gemini_client.files.upload(file=file_path)
+            logging.info("Successfully uploaded %s", gemini_file.name)
+            return index, gemini_file, True
+
+        except Exception as e:
+            logging.warning("Error processing file %s: %s", file_name, e)
+            # Fallback to direct upload if hash calculation fails
+            logging.info("Falling back to direct upload for: %s", file_name)
+            gemini_file = self.gemini_client.files.upload(file=file_path)
+            return index, gemini_file, True
+
+
+class BatchJobSignals(QObject):
+    """Signals emitted by BatchJobTask."""
+
+    job_pending = pyqtSignal(str, str)
+    job_succeeded = pyqtSignal(str, str)
+    job_failed = pyqtSignal(str, str, str)
+    request_failed = pyqtSignal(str, str)
+
+
+class BatchJobTask(QRunnable):
+    """
+    Runnable that checks (and optionally cancels) a Gemini batch job with a
+    single short API call. The GUI runs one every POLL_INTERVAL_S seconds
+    until the job ends, so no pool thread waits on the job itself.
+    """
+
+    POLL_INTERVAL_S = 30
+    # Bare state names: the SDK reports some states as JOB_STATE_* and passes
+    # others (e.g. BATCH_STATE_EXPIRED) through unchanged
+    FINAL_STATES = {"SUCCEEDED", "FAILED", "CANCELLED", "EXPIRED"}
+
+    def __init__(self, gemini_client, job_name, cancel=False):
+        super().__init__()
+        self.signals = BatchJobSignals()
+        self.gemini_client = gemini_client
+        self.job_name = job_name
+        self.cancel = cancel
+
+    def run(self):
+        try:
+            if self.cancel:
+                logging.info("Cancelling Gemini batch job %s...", self.job_name)
+                self.gemini_client.batches.cancel(name=self.job_name)
+            batch_job = self.gemini_client.batches.get(name=self.job_name)
+            state = batch_job.state.name.removeprefix("JOB_STATE_")
+            state = state.removeprefix("BATCH_STATE_")
+            if state not in self.FINAL_STATES:
+                logging.info("Gemini batch job %s is %s", self.job_name, state)
+                self.signals.job_pending.emit(self.job_name, state)
+                return
+            if state != "SUCCEEDED":
+                logging.warning(
+                    "Gemini batch job %s ended with state %s: %s",
+                    self.job_name,
+                    state,
+                    batch_job.error,
+                )
+                self.signals.job_failed.emit(self.job_name, state, str(batch_job.error))
+                return
+            inlined_response = batch_job.dest.inlined_responses[0]
+            if inlined_response.error:
+                logging.warning(
+                    "Gemini batch request %s failed: %s",
+                    self.job_name,
+                    inlined_response.error,
+                )
+                self.signals.job_failed.emit(
+                    self.job_name, state, str(inlined_response.error)
+                )
+                return
+            result_text = inlined_response.response.text or ""
+        except Exception as e:
+            logging.warning("Could not check batch job %s: %s", self.job_name, e)
+            self.signals.request_failed.emit(self.job_name, str(e))
+        else:
+            logging.info("Gemini batch job %s completed.", self.job_name)
+            self.signals.job_succeeded.emit(self.job_name, result_text)
+
+
+class SaveFileSignals(QObject):
+    """Signals emitted by SaveFileTask."""
+
+    file_saved = pyqtSignal(str)
+    save_failed = pyqtSignal(str, str)
+
+
+class SaveFileTask(QRunnable):
+    """Runnable that writes a result file without blocking the GUI thread."""
+
+    def __init__(self, file_path, content):
+        super().__init__()
+        self.signals = SaveFileSignals()
+        self.file_path = file_path
+        self.content = content
+
+    def run(self):
+        logging.info("Saving result to %s...", self.file_path)
+        try:
+            write_text_atomic(self.file_path, self.content)
+        except Exception as e:
+            logging.error("Error saving %s: %s", self.file_path, e, exc_info=True)
+            self.signals.save_failed.emit(self.file_path, str(e))
+        else:
+            logging.info("Result saved to %s.", self.file_path)
+            self.signals.file_saved.emit(self.file_path)
+
 
 class AudioSummaryApp(QWidget):
 
     DEFAULT_PROMPT = "Esegui una trascrizione e riassunto dei file audio forniti."
+    HASH_CACHE_SIZE = 256
+    GEMINI_FILE_LIMIT_BYTES = 2 * 1024**3  # Gemini Files API per-file limit
 
     def __init__(self):
         logging.info("AudioSummaryApp initialization started.")
@@ -240,18 +476,80 @@ class AudioSummaryApp(QWidget):
         self.setGeometry(100, 100, 1300, 1000)
 
         self.gemini_api_key = None
+        self.gemini_client = None
+        self._gemini_client_lock = threading.Lock()
         self.load_api_key()
-        self.processing_thread = None
+        self.processing_signals = None
+        self.save_signals = None
         self.audio_file_paths = []
         self.last_result_text = ""
+        self.result_audio_path = ""
         self.result_is_unsaved = False
+        self.processing_active = False
+        self.hash_cache = {}
+        self.pending_batch_jobs = {}  # job name -> first audio file of the run
+        self.batch_signals = {}
+        self.ready_batch_results = {}  # job name -> result not yet shown
+        self._batch_job_states = {}
+        self._polling_batch_jobs = set()
+        self._cancelling_batch_jobs = set()
+        self._save_dialog_open = False
+        self._last_progress = -1
+        self._pending_progress = None
         self.settings = QSettings("BitreyDev", "AudioSummaryApp")
+        self._error_box = QMessageBox(
+            QMessageBox.Icon.Critical, "", "", QMessageBox.StandardButton.Ok, self
+        )
+
+        # Coalesces bursts of progress signals into one repaint per interval
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(50)
+        self._progress_timer.timeout.connect(self.flush_progress)
+
+        # Appends the streamed partial result at most ~10 times per second
+        self._pending_result_parts = []
+        self._result_render_timer = QTimer(self)
+        self._result_render_timer.setSingleShot(True)
+        self._result_render_timer.setInterval(100)
+        self._result_render_timer.timeout.connect(self.render_partial_result)
+
+        # Checks pending batch jobs, which may take hours to complete
+        self._batch_poll_timer = QTimer(self)
+        self._batch_poll_timer.setInterval(BatchJobTask.POLL_INTERVAL_S * 1000)
+        self._batch_poll_timer.timeout.connect(self.poll_batch_jobs)
 
         self.init_ui()
         self.load_settings()
+        # Resume the batch jobs left pending by a previous session
+        self.update_batch_polling()
         self.apply_dark_theme()
+        # Runs once the event loop has started, i.e. after the window is shown
+        QTimer.singleShot(0, self.start_prewarm)
         logging.info("AudioSummaryApp initialization completed.")
 
+    def start_prewarm(self):
+        threading.Thread(target=self.prewarm, daemon=True).start()
+
+    def prewarm(self):
+        """
+        Imports the Gemini SDK, builds the client and opens its HTTPS
+        connection in the background, so the first run does not pay for them.
+        A run started meanwhile waits on the import and client locks.
+        """
+        logging.info("Prewarming Gemini SDK and client in the background.")
+        try:
+            from google import genai  # noqa: F401
+            from google.genai import types  # noqa: F401
+
+            if self.gemini_api_key:
+                # A one-item listing is enough to complete the TLS handshake
+                self.get_gemini_client().files.list(config={"page_size": 1})
+        except Exception as e:
+            logging.warning("Could not prewarm the Gemini client: %s", e)
+        else:
+            logging.info("Gemini SDK and client prewarmed.")
+
     def apply_dark_theme(self):
         logging.info("Applying dark theme.")
         self.setStyleSheet(
@@ -314,14 +612,30 @@ class AudioSummaryApp(QWidget):
                 background-color: #2a2a2a;
                 border: 1px solid #444444;
             }
+            QSpinBox {
+                background-color: #444444;
+                color: #ffffff;
+                border: 1px solid #666666;
+            }
+            QSpinBox:disabled {
+                background-color: #2a2a2a;
+                color: #666666;
+                border: 1px solid #444444;
+            }
         """
         )
         logging.info("Dark theme applied.")
 
     def load_api_key(self):
-        logging.info("Loading API keys from .env file.")
-        load_dotenv()
+        # A key exported in the shell wins, so .env is only read when it is
+        # missing. The .env values are not copied into os.environ, so a
+        # reload reads the file again with the same precedence.
         self.gemini_api_key = os.getenv("GEMINI_API_KEY")
+        if not self.gemini_api_key:
+            logging.info("Loading API keys from .env file.")
+            from dotenv import dotenv_values
+
+            self.gemini_api_key = dotenv_values().get("GEMINI_API_KEY")
         if not self.gemini_api_key:
             warning_msg_gemini = "GEMINI_API_KEY is not set in the .env file."
             logging.warning(warning_msg_gemini)
@@ -334,6 +648,34 @@ class AudioSummaryApp(QWidget):
             logging.info("GEMINI_API_KEY loaded successfully.")
         logging.info("API keys loading process completed.")
 
+    def reload_api_key(self):
+        logging.info("Reloading API keys.")
+        previous_api_key = self.gemini_api_key
+        self.load_api_key()
+        if self.gemini_api_key != previous_api_key:
+            # Build a new client for the new key on the next run
+            with self._gemini_client_lock:
+                self.gemini_client = None
+        if self.gemini_api_key:
+            self.status_label.setText("Chiave API ricaricata.")
+        else:
+            self.status_label.setText("Chiave API non trovata.")
+
+    def get_gemini_client(self):
+        """
+        Returns the Gemini client, creating it on first use. The same client
+        is reused across runs so its HTTP connections stay warm.
+        """
+        # Also called from the prewarm thread
+        with self._gemini_client_lock:
+            if self.gemini_client is None:
+                from google import genai
+
+                logging.info("Initializing Gemini client.")
+                self.gemini_client = genai.Client(api_key=self.gemini_api_key)
+                logging.info("Gemini client initialized.")
+            return self.gemini_client
+
     def init_ui(self):
         logging.info("Initializing user interface.")
         self.layout = QVBoxLayout()
@@ -366,6 +708,32 @@ class AudioSummaryApp(QWidget):
         self.search_checkbox.setChecked(False)  # Imposta lo stato predefinito
         self.layout.addWidget(self.search_checkbox)
 
+        self.batch_checkbox = QCheckBox(
+            "Modalità batch (costa la metà, ma la risposta può richiedere ore)",
+            self,
+        )
+        self.batch_checkbox.setChecked(False)
+        self.batch_checkbox.toggled.connect(self.on_batch_mode_toggled)
+        batch_layout = QHBoxLayout()
+        batch_layout.addWidget(self.batch_checkbox)
+        self.cancel_batch_button = QPushButton("Annulla job batch", self)
+        self.cancel_batch_button.clicked.connect(self.cancel_batch_jobs)
+        self.cancel_batch_button.setEnabled(False)
+        batch_layout.addWidget(self.cancel_batch_button)
+        batch_layout.addStretch()
+        self.layout.addLayout(batch_layout)
+
+        parallel_uploads_layout = QHBoxLayout()
+        self.parallel_uploads_label = QLabel("Caricamenti paralleli:", self)
+        parallel_uploads_layout.addWidget(self.parallel_uploads_label)
+        self.parallel_uploads_spinbox = QSpinBox(self)
+        self.parallel_uploads_spinbox.setRange(1, 16)
+        self.parallel_uploads_spinbox.setValue(ProcessingTask.MAX_PARALLEL_UPLOADS)
+        self.parallel_uploads_spinbox.valueChanged.connect(self.save_settings)
+        parallel_uploads_layout.addWidget(self.parallel_uploads_spinbox)
+        parallel_uploads_layout.addStretch()
+        self.layout.addLayout(parallel_uploads_layout)
+
         self.process_button = QPushButton("Elabora!", self)
         self.process_button.clicked.connect(self.start_processing)
         self.process_button.setEnabled(False)
@@ -388,6 +756,9 @@ class AudioSummaryApp(QWidget):
         save_shortcut = QShortcut(QKeySequence("Ctrl+S"), self)
         save_shortcut.activated.connect(self.handle_save_shortcut)
 
+        reload_keys_shortcut = QShortcut(QKeySequence("F5"), self)
+        reload_keys_shortcut.activated.connect(self.reload_api_key)
+
         logging.info("User interface initialized.")
 
     def load_settings(self):
@@ -396,13 +767,43 @@ class AudioSummaryApp(QWidget):
         saved_prompt = self.settings.value("userPrompt", self.DEFAULT_PROMPT)
         self.user_prompt_text_edit.setPlainText(saved_prompt)
         self.user_prompt_text_edit.textChanged.connect(self.save_settings)
+        saved_parallel_uploads = self.settings.value(
+            "maxParallelUploads", ProcessingTask.MAX_PARALLEL_UPLOADS, type=int
+        )
+        self.parallel_uploads_spinbox.blockSignals(True)
+        self.parallel_uploads_spinbox.setValue(saved_parallel_uploads)
+        self.parallel_uploads_spinbox.blockSignals(False)
+        # Stored as [path, entry] pairs in LRU order: a saved dict comes back
+        # sorted by key, which would lose the order
+        self.hash_cache = dict(self.settings.value("hashCache", []) or [])
+        self.pending_batch_jobs = dict(
+            self.settings.value("pendingBatchJobs", {}) or {}
+        )
         logging.info("Settings loaded.")
 
     def save_settings(self):
         logging.info("Saving settings to QSettings.")
         self.settings.setValue("userPrompt", self.user_prompt_text_edit.toPlainText())
+        self.settings.setValue(
+            "maxParallelUploads", self.parallel_uploads_spinbox.value()
+        )
         logging.info("Settings saved.")
 
+    def save_hash_cache(self):
+        # Keep only the most recently used entries (dict is in LRU order)
+        excess = len(self.hash_cache) - self.HASH_CACHE_SIZE
+        for file_path in list(self.hash_cache)[: max(excess, 0)]:
+            del self.hash_cache[file_path]
+        self.settings.setValue(
+            "hashCache", [[path, entry] for path, entry in self.hash_cache.items()]
+        )
+        logging.info("Saved %s cached file hashes.", len(self.hash_cache))
+
+    def save_pending_batch_jobs(self):
+        self.settings.setValue("pendingBatchJobs", self.pending_batch_jobs)
+        logging.info("Saved %s pending batch jobs.", len(self.pending_batch_jobs))
+        self.update_batch_polling()
+
     def reset_prompt(self):
         logging.info("Resetting prompt to default.")
         self.user_prompt_text_edit.setPlainText(self.DEFAULT_PROMPT)
@@ -463,47 +864,102 @@ class AudioSummaryApp(QWidget):
             QMessageBox.warning(
                 self,
                 "Chiave API mancante",
-                "Imposta GEMINI_API_KEY nel tuo file .env e riavvia.",
+                "Imposta GEMINI_API_KEY nel tuo file .env e premi F5.",
+            )
+            return
+
+        # Fail fast instead of after uploading every other file
+        try:
+            oversized_files = [
+                os.path.basename(path)
+                for path in self.audio_file_paths
+                if os.path.getsize(path) > self.GEMINI_FILE_LIMIT_BYTES
+            ]
+        except OSError as e:
+            # The file may have been moved or deleted since it was selected
+            logging.error("Error reading the selected files: %s", e)
+            self.show_error(
+                "Errore di elaborazione", f"Impossibile leggere il file: {e}"
+            )
+            return
+        if oversized_files:
+            QMessageBox.warning(
+                self,
+                "File troppo grandi",
+                "Gemini accetta file fino a 2 GB. Troppo grandi: "
+                + ", ".join(oversized_files),
             )
             return
 
         self.status_label.setText("Avvio del processo...")
-        self.process_button.setEnabled(False)
-        self.user_prompt_text_edit.setEnabled(False)  # Disable prompt during processing
-        self.search_checkbox.setEnabled(False)  # Disabilita anche la checkbox
+        self.processing_active = True
+        self.set_inputs_enabled(False)
+        self._progress_timer.stop()
+        self._pending_progress = None
         self.progress_bar.setValue(0)
+        self._last_progress = 0
+        self._result_render_timer.stop()
+        self._pending_result_parts = []
         self.output_text_edit.clear()
+        self.result_audio_path = self.audio_file_paths[0]
 
         user_prompt = self.user_prompt_text_edit.toPlainText()
 
         # Leggi lo stato della checkbox
         use_google_search = self.search_checkbox.isChecked()
 
-        logging.info("Creating and starting processing thread.")
+        logging.info("Creating and starting processing task.")
 
-        self.processing_thread = ProcessingThread(
+        processing_task = ProcessingTask(
             self.audio_file_paths,
-            self.gemini_api_key,
+            self.get_gemini_client(),
             user_prompt,
             enable_search=use_google_search,
+            hash_cache=self.hash_cache,
+            batch_mode=self.batch_checkbox.isChecked(),
+            max_parallel_uploads=self.parallel_uploads_spinbox.value(),
         )
-        self.processing_thread.processing_finished.connect(self.display_result)
-        self.processing_thread.error_occurred.connect(self.display_error)
-        self.processing_thread.progress_update.connect(self.update_progress)
-        self.processing_thread.status_update.connect(self.update_status)
-        self.processing_thread.start()
-        logging.info("Processing thread started.")
+        # Keep a reference to the signals: the pool deletes the task when done
+        self.processing_signals = processing_task.signals
+        self.processing_signals.processing_finished.connect(self.display_result)
+        self.processing_signals.result_chunk.connect(self.append_result_chunk)
+        self.processing_signals.error_occurred.connect(self.display_error)
+        self.processing_signals.progress_update.connect(self.update_progress)
+        self.processing_signals.status_update.connect(self.update_status)
+        self.processing_signals.batch_job_submitted.connect(self.on_batch_job_submitted)
+        QThreadPool.globalInstance().start(processing_task)
+        logging.info("Processing task started.")
+
+    def append_result_chunk(self, chunk_text):
+        """Collects a streamed piece of the result and schedules a redraw."""
+        self._pending_result_parts.append(chunk_text)
+        if not self._result_render_timer.isActive():
+            self._result_render_timer.start()
+
+    def render_partial_result(self):
+        # Only append the new text at the end of the document: re-parsing the
+        # whole partial result on every tick is quadratic in its length.
+        # The formatted markdown is rendered once in display_result.
+        pending_text = "".join(self._pending_result_parts)
+        self._pending_result_parts.clear()
+        output = self.output_text_edit
+        output.setUpdatesEnabled(False)
+        cursor = output.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(pending_text)
+        output.setUpdatesEnabled(True)
 
     def display_result(self, result_text):
         logging.info("Displaying result from Gemini.")
+        self._result_render_timer.stop()
+        self._progress_timer.stop()
 
-        html_content = mistune.html(result_text)
-        self.output_text_edit.setHtml(html_content)
+        self.output_text_edit.setMarkdown(result_text)
+        self.save_hash_cache()
 
         self.status_label.setText("Finito!!")
-        self.process_button.setEnabled(True)
-        self.user_prompt_text_edit.setEnabled(True)
-        self.search_checkbox.setEnabled(True)  # Riattiva la checkbox
+        self.processing_active = False
+        self.set_inputs_enabled(True)
         self.progress_bar.setValue(100)
 
         # Store result for saving
@@ -513,6 +969,201 @@ class AudioSummaryApp(QWidget):
         self.prompt_save_file()
         logging.info("Result displayed and UI updated.")
 
+    def set_inputs_enabled(self, enabled):
+        """Enables or disables the inputs that must not change during a run."""
+        self.process_button.setEnabled(enabled)
+        self.user_prompt_text_edit.setEnabled(enabled)
+        self.search_checkbox.setEnabled(enabled and not self.batch_checkbox.isChecked())
+        self.batch_checkbox.setEnabled(enabled)
+        self.parallel_uploads_spinbox.setEnabled(enabled)
+
+    def on_batch_mode_toggled(self, checked):
+        # SDK 1.38 serializes an inlined batch request's tools next to the
+        # request instead of inside it, so grounding would be lost or rejected
+        if checked:
+            self.search_checkbox.setChecked(False)
+        self.search_checkbox.setEnabled(not checked)
+
+    def on_batch_job_submitted(self, job_name, audio_file_path):
+        logging.info("Batch job %s submitted, polling it in the background.", job_name)
+        self._progress_timer.stop()
+        self.save_hash_cache()
+        self.pending_batch_jobs[job_name] = audio_file_path
+        self.save_pending_batch_jobs()
+        self.status_label.setText(
+            "Job batch inviato: il risultato apparirà qui quando sarà pronto."
+        )
+        self.processing_active = False
+        self.set_inputs_enabled(True)
+        self.show_ready_batch_result()
+
+    def running_batch_jobs(self):
+        """Pending batch jobs whose result has not arrived yet."""
+        return [
+            job_name
+            for job_name in self.pending_batch_jobs
+            if job_name not in self.ready_batch_results
+        ]
+
+    def update_batch_polling(self):
+        """Polls batch jobs only while some are still running."""
+        has_running_jobs = bool(self.running_batch_jobs())
+        self.cancel_batch_button.setEnabled(has_running_jobs)
+        if not has_running_jobs:
+            self._batch_poll_timer.stop()
+        elif not self._batch_poll_timer.isActive():
+            self._batch_poll_timer.start()
+
+    def poll_batch_jobs(self):
+        for job_name in self.running_batch_jobs():
+            if job_name not in self._polling_batch_jobs:
+                self.start_batch_job_task(job_name)
+
+    def start_batch_job_task(self, job_name, cancel=False):
+        if not self.gemini_api_key:
+            return
+        batch_job_task = BatchJobTask(self.get_gemini_client(), job_name, cancel)
+        # Keep a reference to the signals: the pool deletes the task when done
+        signals = self.batch_signals[job_name] = batch_job_task.signals
+        signals.job_pending.connect(self.on_batch_job_pending)
+        signals.job_succeeded.connect(self.on_batch_job_succeeded)
+        signals.job_failed.connect(self.on_batch_job_failed)
+        signals.request_failed.connect(self.on_batch_request_failed)
+        self._polling_batch_jobs.add(job_name)
+        QThreadPool.globalInstance().start(batch_job_task)
+
+    def cancel_batch_jobs(self):
+        running_jobs = self.running_batch_jobs()
+        answer = QMessageBox.question(
+            self,
+            "Annulla job batch",
+            f"Annullare {len(running_jobs)} job batch in attesa?",
+        )
+        if answer != QMessageBox.StandardButton.Yes:
+            return
+        logging.info("Cancelling %s batch jobs.", len(running_jobs))
+        if not self.gemini_api_key:
+            for job_name in running_jobs:
+                self.offer_to_drop_batch_job(job_name, "chiave API mancante")
+            return
+        self.status_label.setText("Annullamento dei job batch...")
+        for job_name in running_jobs:
+            self._cancelling_batch_jobs.add(job_name)
+            self.start_batch_job_task(job_name, cancel=True)
+
+    def offer_to_drop_batch_job(self, job_name, reason):
+        """Lets the user forget a job that can no longer be reached."""
+        answer = QMessageBox.question(
+            self,
+            "Annulla job batch",
+            f"Impossibile annullare il job batch {job_name} ({reason}). "
+            "Rimuoverlo comunque dai job in attesa?",
+        )
+        if answer != QMessageBox.StandardButton.Yes:
+            return
+        logging.info("Dropping batch job %s without cancelling it.", job_name)
+        self.forget_batch_job_task(job_name)
+        if self.pending_batch_jobs.pop(job_name, None) is not None:
+            self.save_pending_batch_jobs()
+        self.status_label.setText("Job batch rimosso.")
+
+    def forget_batch_job_task(self, job_name):
+        """Drops the polling state of a job that has reached a final state."""
+        self.batch_signals.pop(job_name, None)
+        self._batch_job_states.pop(job_name, None)
+
+    def on_batch_job_pending(self, job_name, state):
+        self._polling_batch_jobs.discard(job_name)
+        self._cancelling_batch_jobs.discard(job_name)
+        # Only report changes, so other messages are not hidden every poll
+        if self._batch_job_states.get(job_name) == state:
+            return
+        self._batch_job_states[job_name] = state
+        if not self.processing_active:
+            self.status_label.setText(
+                f"Job batch in attesa ({state}), "
+                f"controllo ogni {BatchJobTask.POLL_INTERVAL_S}s..."
+            )
+
+    def on_batch_job_succeeded(self, job_name, result_text):
+        self._polling_batch_jobs.discard(job_name)
+        self._cancelling_batch_jobs.discard(job_name)
+        self.forget_batch_job_task(job_name)
+        if job_name not in self.pending_batch_jobs:
+            return
+        # Stays in pendingBatchJobs until shown, so a restart fetches it again
+        self.ready_batch_results[job_name] = result_text
+        self.update_batch_polling()
+        self.show_ready_batch_result()
+
+    def show_ready_batch_result(self):
+        """
+        Shows the oldest finished batch result, unless a run or the save
+        dialog is in progress, or the user keeps the current unsaved result.
+        """
+        if (
+            not self.ready_batch_results
+            or self.processing_active
+            or self._save_dialog_open
+        ):
+            return
+        if self.result_is_unsaved:
+            answer = QMessageBox.question(
+                self,
+                "Job batch completato",
+                "Un job batch è pronto. Sostituire il risultato attuale, "
+                "che non è ancora stato salvato?",
+            )
+            if answer != QMessageBox.StandardButton.Yes:
+                self.status_label.setText(
+                    "Job batch pronto: salva il risultato attuale (Ctrl+S) "
+                    "per vederlo."
+                )
+                return
+
+        job_name = next(iter(self.ready_batch_results))
+        result_text = self.ready_batch_results.pop(job_name)
+        audio_file_path = self.pending_batch_jobs.pop(job_name)
+        self.save_pending_batch_jobs()
+        logging.info("Displaying result of batch job %s.", job_name)
+
+        self.output_text_edit.setMarkdown(result_text)
+        self.status_label.setText("Job batch completato!")
+
+        # Store result for saving
+        self.last_result_text = result_text
+        self.result_audio_path = audio_file_path
+        self.result_is_unsaved = bool(result_text)
+
+        self.prompt_save_file()
+
+    def on_batch_job_failed(self, job_name, state, error_message):
+        self._polling_batch_jobs.discard(job_name)
+        self._cancelling_batch_jobs.discard(job_name)
+        self.forget_batch_job_task(job_name)
+        if self.pending_batch_jobs.pop(job_name, None) is None:
+            return
+        self.save_pending_batch_jobs()
+        if state == "CANCELLED":
+            self.status_label.setText("Job batch annullato.")
+            return
+        self.show_error(
+            "Errore del job batch",
+            f"Il job batch {job_name} è terminato con stato {state}: "
+            f"{error_message}",
+        )
+
+    def on_batch_request_failed(self, job_name, error_message):
+        self._polling_batch_jobs.discard(job_name)
+        if job_name in self._cancelling_batch_jobs:
+            self._cancelling_batch_jobs.discard(job_name)
+            self.offer_to_drop_batch_job(job_name, error_message)
+            return
+        # Retried on the next tick of the poll timer
+        self.status_label.setText(
+            f"Impossibile contattare Gemini per il job batch: {error_message}"
+        )
+
     def prompt_save_file(self):
         if not self.last_result_text:
             return
@@ -525,52 +1176,95 @@ class AudioSummaryApp(QWidget):
         file_dialog = QFileDialog()
         last_save_directory = self.settings.value("lastSaveDirectory", "")
         # Use the first audio file's name as a base for the output file
-        base_name = os.path.splitext(os.path.basename(self.audio_file_paths[0]))[0]
+        base_name = os.path.splitext(os.path.basename(self.result_audio_path))[0]
         default_file_name = os.path.join(
             last_save_directory, f"{base_name}_{default_suffix}"
         )
 
+        # Batch results arriving meanwhile wait until the dialog is closed
+        self._save_dialog_open = True
         file_path, _ = file_dialog.getSaveFileName(
             self, dialog_title, default_file_name, file_filter
         )
+        self._save_dialog_open = False
 
         if file_path:
             last_save_directory = os.path.dirname(file_path)
             self.settings.setValue("lastSaveDirectory", last_save_directory)
-            try:
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(content_to_save)
-                self.status_label.setText(f"File salvato in: {file_path}")
-                self.result_is_unsaved = False
-            except Exception as e:
-                QMessageBox.critical(
-                    self,
-                    "Errore di salvataggio",
-                    f"Errore durante il salvataggio del file: {e}",
-                )
+            self.status_label.setText("Salvataggio in corso...")
+            self.result_is_unsaved = False
+
+            save_task = SaveFileTask(file_path, content_to_save)
+            # Keep a reference to the signals: the pool deletes the task when done
+            self.save_signals = save_task.signals
+            self.save_signals.file_saved.connect(self.on_file_saved)
+            self.save_signals.save_failed.connect(self.on_save_failed)
+            QThreadPool.globalInstance().start(save_task)
         else:
             self.status_label.setText(
                 "File non salvato - puoi premere Ctrl+S per salvare."
             )
+            self.show_ready_batch_result()
+
+    def on_file_saved(self, file_path):
+        self.status_label.setText(f"File salvato in: {file_path}")
+        self.show_ready_batch_result()
+
+    def on_save_failed(self, file_path, error_message):
+        self.result_is_unsaved = True
+        self.status_label.setText("File non salvato - puoi premere Ctrl+S per salvare.")
+        self.show_error(
+            "Errore di salvataggio",
+            f"Errore durante il salvataggio del file: {error_message}",
+        )
 
     def handle_save_shortcut(self):
         if self.result_is_unsaved:
             self.prompt_save_file()
 
     def display_error(self, error_message, file_path):
-        logging.error(f"Error occurred: {error_message} for file: {file_path}")
-        QMessageBox.critical(self, "Errore di elaborazione", error_message)
+        logging.error("Error occurred: %s for file: %s", error_message, file_path)
+        self._result_render_timer.stop()
+        self._progress_timer.stop()
+        self.save_hash_cache()
+        self.show_error("Errore di elaborazione", error_message)
         file_name = os.path.basename(file_path)
         self.status_label.setText(f"Errore durante l'elaborazione di {file_name}.")
-        self.process_button.setEnabled(True)
-        self.user_prompt_text_edit.setEnabled(True)
-        self.search_checkbox.setEnabled(True)  # Riattiva la checkbox
+        self.processing_active = False
+        self.set_inputs_enabled(True)
         self.progress_bar.setValue(0)
-        logging.error(f"Error displayed in UI for file: {file_name}")
+        self.show_ready_batch_result()
+        logging.error("Error displayed in UI for file: %s", file_name)
+
+    def show_error(self, title, message):
+        """Shows an error using the shared critical message box."""
+        if self._error_box.isVisible():
+            # exec() is not re-entrant: an error arriving while the shared box
+            # is open (e.g. from a background save) gets a box of its own
+            QMessageBox.critical(self, title, message)
+            return
+        self._error_box.setWindowTitle(title)
+        self._error_box.setText(message)
+        self._error_box.exec()
 
     def update_progress(self, progress_value):
+        # Keep only the latest value and repaint at most every 50 ms;
+        # the reset (0) and final (100) values are always drawn immediately.
+        self._pending_progress = progress_value
+        if progress_value in (0, 100):
+            self._progress_timer.stop()
+            self.flush_progress()
+        elif not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def flush_progress(self):
+        progress_value = self._pending_progress
+        self._pending_progress = None
+        if progress_value is None or progress_value == self._last_progress:
+            return
         self.progress_bar.setValue(progress_value)
-        logging.debug(f"Progress bar updated to: {progress_value}%")
+        self._last_progress = progress_value
+        logging.debug("Progress bar updated to: %s%%", progress_value)
 
     def update_status(self, message):
         """Updates the status label with a message from the processing thread."""
@@ -579,9 +1273,12 @@ class AudioSummaryApp(QWidget):
 
 if __name__ == "__main__":
     logging.info("Application started.")
-    app = QApplication(sys.argv)
+    # Only hand argv to Qt when it may contain Qt options, so the common
+    # "python gui.py" launch skips Qt's argument parsing.
+    qt_argv = sys.argv if any(a.startswith("-") for a in sys.argv[1:]) else sys.argv[:1]
+    app = QApplication(qt_argv)
     main_window = AudioSummaryApp()
     main_window.show()
     exit_code = app.exec()
-    logging.info(f"Application exited with code: {exit_code}")
+    logging.info("Application exited with code: %s", exit_code)
     sys.exit(exit_code)